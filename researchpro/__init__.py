@@ -0,0 +1 @@
+"""ResearchPro Agent package."""
@@ -0,0 +1,985 @@
+"""
+ResearchPro Agent - An intelligent research assistant using LangChain and Ollama.
+
+This agent demonstrates:
+- Tool Calling with 2 essential tools (web_search, scrape_webpage)
+- State Management with TypedDict
+- Middleware for dynamic prompts
+- Local Ollama (gpt-oss:120b-cloud)
+"""
+
+import asyncio
+import concurrent.futures
+import os
+import threading
+from collections import deque
+from dotenv import load_dotenv
+from typing import Literal, Annotated
+from typing_extensions import TypedDict
+
+# Load environment variables from .env file
+load_dotenv()
+
+import httpx
+import orjson
+from langchain_ollama import ChatOllama
+from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, ToolMessage
+from langchain.globals import set_llm_cache
+from langchain_community.cache import SQLiteCache
+from langgraph.graph import StateGraph, END
+
+# Import our custom components
+from .schemas import ResearchState
+from .middleware import get_dynamic_system_prompt, format_tool_error, window_context_messages
+from .tools import web_search, scrape_webpage
+from .utils import ConversationMemory, ExecutionCache
+
+# Set once per process; LangChain's LLM cache is a global
+_llm_cache_initialized = False
+
+# Process-wide caches so repeated agent construction with the same
+# configuration reuses the LLM client and the compiled graph instead of
+# rebuilding the whole LangChain object graph each time
+_LLM_CACHE = {}
+_GRAPH_CACHE = {}
+_BIND_CACHE = {}
+_cache_lock = threading.Lock()
+
+# Connection-pool settings shared by the Ollama HTTP clients: keep-alive
+# skips the TCP handshake per request, and the pool is sized for parallel
+# tool calls and batch research traffic. Since LLM clients are cached per
+# config, one pool serves the whole process.
+_HTTP_CLIENT_KWARGS = {
+    "limits": httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    "timeout": httpx.Timeout(60.0),
+}
+
+# Hard bound on agent-tool cycles per query; after this many turns the
+# agent is forced to answer with whatever it has gathered.
+MAX_TOOL_ITERATIONS = 3
+
+
+# Prebuilt instruction appended when the tool budget runs out
+_FORCE_FINAL_MSG = HumanMessage(content="STOP. You have all the information you need from the tools. Now write a comprehensive final answer. Write your answer as plain text. Do NOT call any more tools.")
+
+
+def _is_trivial_tool_result(content: str) -> bool:
+    """
+    True when a tool output carries no usable information.
+
+    Tool responses are JSON with a `status` field; parsing it is the only
+    reliable check — the serialized form varies (compact by default,
+    indented under TOOL_DEBUG), and scraped page text can contain any
+    substring we might match against.
+    """
+    if not content:
+        return True
+    try:
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return False
+    return isinstance(data, dict) and data.get("status") in ("error", "no_results")
+
+
+class AgentConfig:
+    """Configuration for the ResearchPro Agent."""
+    
+    def __init__(
+        self,
+        model_name: str = "gpt-oss:120b-cloud",
+        base_url: str = "http://localhost:11434",
+        temperature: float = 0.3,
+        user_level: Literal["expert", "beginner", "general"] = "general",
+        save_conversations: bool = True,
+        storage_dir: str = "conversations",
+        use_cache: bool = True,
+        cache_dir: str = ".cache",
+        max_context_turns: int = 6,
+        max_context_messages: int = 40,
+        use_langgraph: bool = False
+    ):
+        self.model_name = model_name
+        self.base_url = base_url
+        self.temperature = temperature
+        self.user_level = user_level
+        self.save_conversations = save_conversations
+        self.storage_dir = storage_dir
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+        self.max_context_turns = max_context_turns
+        self.max_context_messages = max_context_messages
+        self.use_langgraph = use_langgraph
+
+
+class ResearchProAgent:
+    """
+    Main ResearchPro Agent class.
+    
+    This agent uses a ReAct (Reasoning + Acting) pattern to conduct research.
+    It can search the web and scrape pages to gather information.
+    """
+    
+    def __init__(self, config: AgentConfig = None):
+        """Initialize the ResearchPro Agent."""
+        self.config = config or AgentConfig()
+        
+        # Initialize conversation memory
+        self.memory = ConversationMemory(self.config.storage_dir) if self.config.save_conversations else None
+        self.active_conversation_id = None  # Track current conversation session
+        self.context_messages = self._new_context()  # Loaded conversation context
+
+        # Background writer so conversation saves never delay the answer
+        self._save_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="memory-save"
+        )
+        self._pending_saves = []
+
+        # Initialize execution cache (exact-match query results) and the
+        # process-wide LLM-level cache
+        if self.config.use_cache:
+            self.exec_cache = ExecutionCache(self.config.cache_dir)
+            global _llm_cache_initialized
+            if not _llm_cache_initialized:
+                set_llm_cache(SQLiteCache(
+                    database_path=os.path.join(self.config.cache_dir, "llm_cache.db")
+                ))
+                _llm_cache_initialized = True
+        else:
+            self.exec_cache = None
+
+        # Reuse the LLM client and compiled graph for identical configurations
+        cache_key = (
+            self.config.model_name,
+            self.config.base_url,
+            round(self.config.temperature, 3),
+            self.config.user_level
+        )
+
+        with _cache_lock:
+            llm = _LLM_CACHE.get(cache_key)
+            if llm is None:
+                # Initialize local Ollama LLM
+                llm = ChatOllama(
+                    model=self.config.model_name,
+                    base_url=self.config.base_url,
+                    temperature=self.config.temperature,
+                    client_kwargs=_HTTP_CLIENT_KWARGS
+                )
+                _LLM_CACHE[cache_key] = llm
+        self.llm = llm
+
+        # Bind only essential tools to the LLM. The tool order is sorted and
+        # frozen so the serialized tool schemas are byte-identical across
+        # runs, keeping the backend's prompt-prefix (KV) cache warm.
+        self.tools = tuple(sorted(self.default_tools(), key=lambda t: t.name))
+        self._tools_by_name = {t.name: t for t in self.tools}
+
+        # System message is injected once per query at research() entry,
+        # not re-checked on every graph step
+        self._system_msg = SystemMessage(
+            content=get_dynamic_system_prompt(self.config.user_level)
+        )
+
+        # bind_tools generates JSON schemas from the tool signatures, so
+        # memoize it per (LLM instance, tool names); id(self.llm) is stable
+        # here because the LLM itself comes from _LLM_CACHE
+        bind_key = (id(self.llm), tuple(t.name for t in self.tools))
+        with _cache_lock:
+            llm_with_tools = _BIND_CACHE.get(bind_key)
+            if llm_with_tools is None:
+                llm_with_tools = self.llm.bind_tools(list(self.tools))
+                _BIND_CACHE[bind_key] = llm_with_tools
+        self.llm_with_tools = llm_with_tools
+
+        # Build (or reuse) the agent graph
+        with _cache_lock:
+            graph = _GRAPH_CACHE.get(cache_key)
+            if graph is None:
+                graph = self._build_graph()
+                _GRAPH_CACHE[cache_key] = graph
+        self.graph = graph
+
+    def _new_context(self, messages=()) -> deque:
+        """
+        Create a bounded context buffer.
+
+        An append-only deque avoids the O(n) list copy per turn, and its
+        maxlen automatically windows very old messages out.
+        """
+        return deque(messages, maxlen=self.config.max_context_messages)
+
+    @staticmethod
+    def default_tools() -> list:
+        """Return the default tool set bound to the agent."""
+        return [
+            web_search,
+            scrape_webpage,
+        ]
+    
+    def _build_graph(self):
+        """Build the LangGraph workflow."""
+
+        # Bind hot objects to locals so the per-step closures load them as
+        # free variables instead of walking attribute chains on every turn
+        llm = self.llm
+        llm_with_tools = self.llm_with_tools
+        force_msg = _FORCE_FINAL_MSG
+
+        # Define the agent node
+        async def agent_node(state: ResearchState) -> ResearchState:
+            """
+            Agent reasoning node.
+
+            The agent decides whether to:
+            1. Use tools to gather more information (possibly several in one turn)
+            2. Provide a final answer
+            """
+            messages = state["messages"]
+            iteration_count = state.get("progress", 0)
+
+            # Out of tool budget - force a final answer without tool binding.
+            # The counter is maintained incrementally by tool_node, so no
+            # O(n) scan over the message list is needed here.
+            if iteration_count >= MAX_TOOL_ITERATIONS:
+                if state.get("tool_message_count", 0):
+                    messages = messages + [force_msg]
+
+                # Stream the final answer token by token; consumers of
+                # astream_events/astream_tokens see the first token after
+                # single-token latency instead of waiting for the full decode
+                parts = []
+                async for chunk in llm.astream(messages):
+                    if chunk.content:
+                        parts.append(chunk.content)
+                response = AIMessage(content="".join(parts))
+
+                # If response is still empty, try to provide something useful
+                if not response.content:
+                    response = AIMessage(content="I apologize, but I encountered an issue generating the final answer. Please try rephrasing your question or asking something different.")
+
+                return {"messages": [response], "progress": iteration_count + 1}
+
+            # Within budget - allow tool use
+            response = await llm_with_tools.ainvoke(messages)
+
+            # Return only the NEW message to be added
+            return {"messages": [response], "progress": iteration_count + 1}
+
+        # Define the tools node
+        async def tool_node(state: ResearchState) -> ResearchState:
+            """
+            Execute all tool calls from the last AI message concurrently.
+
+            The LLM may emit several tool calls in one turn (e.g. web_search
+            + scrape_webpage); running them with asyncio.gather costs one
+            round-trip instead of one per tool.
+            """
+            last_message = state["messages"][-1]
+            tool_calls = getattr(last_message, "tool_calls", None) or []
+            tool_messages = await self._run_tool_calls(tool_calls)
+
+            result_count = len(tool_messages)
+
+            # If every tool call came back empty or errored and the model
+            # already drafted an answer alongside its calls, reuse that
+            # draft instead of paying another LLM call to re-derive it
+            # from nothing
+            prior_content = getattr(last_message, "content", "") or ""
+            if prior_content and tool_messages and all(
+                _is_trivial_tool_result(m.content) for m in tool_messages
+            ):
+                tool_messages.append(AIMessage(content=prior_content))
+
+            return {"messages": tool_messages, "tool_message_count": result_count}
+
+        # Define routing function
+        def should_continue(state: ResearchState) -> Literal["continue", "end"]:
+            """
+            Determine whether to continue or end.
+
+            Route to tools whenever the last message requests them, up to
+            MAX_TOOL_ITERATIONS agent turns.
+            """
+            last_message = state["messages"][-1]
+            iteration_count = state.get("progress", 0)
+
+            # Safety bound on agent-tool cycles
+            if iteration_count > MAX_TOOL_ITERATIONS:
+                return "end"
+
+            # Check if there are tool calls
+            if getattr(last_message, "tool_calls", None):
+                return "continue"
+            return "end"
+        
+        # Build the graph
+        workflow = StateGraph(ResearchState)
+        
+        # Add nodes
+        workflow.add_node("agent", agent_node)
+        workflow.add_node("tools", tool_node)
+        
+        # Set entry point
+        workflow.set_entry_point("agent")
+        
+        # Add conditional edges
+        workflow.add_conditional_edges(
+            "agent",
+            should_continue,
+            {
+                "continue": "tools",
+                "end": END
+            }
+        )
+        
+        # After tools, return to the agent unless tool_node already
+        # synthesized the final answer (trivial tool results)
+        def after_tools(state: ResearchState) -> Literal["agent", "end"]:
+            if getattr(state["messages"][-1], "type", "") == "ai":
+                return "end"
+            return "agent"
+
+        workflow.add_conditional_edges(
+            "tools",
+            after_tools,
+            {
+                "agent": "agent",
+                "end": END
+            }
+        )
+        
+        # Compile the graph
+        return workflow.compile()
+    
+    async def _run_tool_calls(self, tool_calls: list) -> list:
+        """
+        Execute tool calls concurrently.
+
+        Args:
+            tool_calls: Tool calls from an AI message
+
+        Returns:
+            ToolMessages in the original call order
+        """
+        tools_by_name = self._tools_by_name
+
+        async def run_tool(tool_call):
+            tool = tools_by_name.get(tool_call["name"])
+            if tool is None:
+                return f"Unknown tool: {tool_call['name']}"
+            try:
+                return await tool.ainvoke(tool_call["args"])
+            except Exception as e:
+                return format_tool_error(e, tool_call["name"])
+
+        results = await asyncio.gather(*(run_tool(tc) for tc in tool_calls))
+        return [
+            ToolMessage(content=str(result), tool_call_id=tc["id"], name=tc["name"])
+            for tc, result in zip(tool_calls, results)
+        ]
+
+    async def _fast_research_loop(self, initial_messages: list, max_iterations: int = MAX_TOOL_ITERATIONS) -> dict:
+        """
+        Hand-rolled control loop for the fixed agent/tools topology.
+
+        Semantically equivalent to the LangGraph path, but skips the
+        per-step graph dispatch (channel updates, reducers, routing) that
+        costs real time on a graph this small. Streaming entry points
+        still go through the compiled graph.
+
+        Args:
+            initial_messages: System + context + query messages
+            max_iterations: Caller's cycle budget; like the graph's agent
+                node, the loop never exceeds MAX_TOOL_ITERATIONS
+
+        Returns:
+            Final state dict matching the graph's output shape
+        """
+        messages = list(initial_messages)
+        tool_result_count = 0
+        progress = 0
+        iteration_limit = min(max_iterations, MAX_TOOL_ITERATIONS)
+
+        while progress < iteration_limit:
+            response = await self.llm_with_tools.ainvoke(messages)
+            messages.append(response)
+            progress += 1
+
+            tool_calls = getattr(response, "tool_calls", None)
+            if not tool_calls:
+                return {
+                    "messages": messages,
+                    "citations": [],
+                    "progress": progress,
+                    "tool_message_count": tool_result_count
+                }
+
+            tool_messages = await self._run_tool_calls(tool_calls)
+            tool_result_count += len(tool_messages)
+            messages.extend(tool_messages)
+
+            # Same short-circuit as the graph's after_tools edge: reuse the
+            # model's draft when every tool result is empty or errored
+            prior_content = response.content or ""
+            if prior_content and tool_messages and all(
+                _is_trivial_tool_result(m.content) for m in tool_messages
+            ):
+                messages.append(AIMessage(content=prior_content))
+                return {
+                    "messages": messages,
+                    "citations": [],
+                    "progress": progress,
+                    "tool_message_count": tool_result_count
+                }
+
+        # Out of tool budget - force a final answer without tool binding
+        prompt = messages + [_FORCE_FINAL_MSG] if tool_result_count else messages
+        parts = []
+        async for chunk in self.llm.astream(prompt):
+            if chunk.content:
+                parts.append(chunk.content)
+        content = "".join(parts) or "I apologize, but I encountered an issue generating the final answer. Please try rephrasing your question or asking something different."
+        messages.append(AIMessage(content=content))
+
+        return {
+            "messages": messages,
+            "citations": [],
+            "progress": progress + 1,
+            "tool_message_count": tool_result_count
+        }
+
+    def _build_initial_messages(self, query: str, context_messages) -> list:
+        """
+        Build the prompt for one query: windowed context, a leading system
+        message (unless the context already carries one), then the query.
+        """
+        initial_messages = window_context_messages(
+            context_messages, self.config.max_context_turns
+        )
+        if not initial_messages or getattr(initial_messages[0], "type", None) != "system":
+            initial_messages.insert(0, self._system_msg)
+        initial_messages.append(HumanMessage(content=query))
+        return initial_messages
+
+    async def aresearch(self, query: str, max_iterations: int = 10, bypass_cache: bool = False) -> dict:
+        """
+        Conduct research on a given query asynchronously.
+
+        The graph and LLM calls are awaited, so the event loop stays free
+        for other work (e.g. concurrent research requests) while the LLM
+        and tool HTTP calls are in flight.
+
+        Args:
+            query: The research question or topic
+            max_iterations: Maximum number of agent-tool cycles
+            bypass_cache: Skip the execution cache and force a fresh run
+
+        Returns:
+            Final state with messages and results
+        """
+        # Exact-match cache lookup - only valid when there is no prior
+        # conversation context, since the key covers just (model, level, query)
+        cache_key = None
+        if self.exec_cache and not bypass_cache and not self.context_messages:
+            cache_key = ExecutionCache.make_key(
+                self.config.model_name, self.config.user_level, query
+            )
+            cached = self.exec_cache.get(cache_key)
+            if cached is not None:
+                final_state = dict(cached)
+                final_state["messages"] = self._deserialize_messages(final_state["messages"])
+                self.context_messages = self._new_context(final_state["messages"])
+                return final_state
+
+        # Initialize state with windowed context messages, so prompt size
+        # stays bounded no matter how long the conversation runs
+        initial_messages = self._build_initial_messages(query, self.context_messages)
+
+        initial_state = {
+            "messages": initial_messages,
+            "citations": [],
+            "progress": 0,
+            "tool_message_count": 0
+        }
+
+        # Run the research loop (hand-rolled by default; the compiled
+        # graph when configured)
+        try:
+            if self.config.use_langgraph:
+                final_state = await self.graph.ainvoke(
+                    initial_state,
+                    config={"recursion_limit": max_iterations}
+                )
+            else:
+                final_state = await self._fast_research_loop(initial_messages, max_iterations)
+            
+            # This turn's new messages: the query plus everything the run
+            # produced. The save and the context buffer both take exactly
+            # these — the transcript already holds prior turns, and passing
+            # a windowed history would make any on-disk arithmetic wrong.
+            new_messages = final_state["messages"][len(initial_messages) - 1:]
+
+            # Save conversation to memory (in the background, so the caller
+            # sees the answer without waiting on the disk write)
+            if self.memory:
+                answer = self.get_final_answer(final_state)
+                final_state["conversation_id"] = self._save_in_background(
+                    query, answer, new_messages, final_state.get("citations", [])
+                )
+
+            self.context_messages.extend(new_messages)
+
+            # Store in the execution cache with messages pre-serialized to dicts
+            if cache_key:
+                self.exec_cache.put(cache_key, {
+                    "messages": ConversationMemory._serialize_messages(final_state["messages"]),
+                    "citations": final_state.get("citations", []),
+                    "progress": final_state.get("progress", 0)
+                })
+
+            return final_state
+        except Exception as e:
+            error_msg = format_tool_error(e, "agent")
+            return {
+                "messages": initial_state["messages"] + [
+                    AIMessage(content=f"An error occurred: {error_msg}")
+                ],
+                "citations": [],
+                "progress": 0
+            }
+
+    async def _aresearch_detached(self, query: str, context_snapshot: list, max_iterations: int) -> dict:
+        """
+        Run one research query against a fixed context snapshot.
+
+        Unlike aresearch(), this neither reads nor writes instance state
+        (context buffer, active conversation, memory saves), so any number
+        of these coroutines can run concurrently without inheriting each
+        other's context or interleaving saves into one conversation file.
+        The execution cache is still consulted and populated when the
+        snapshot is empty, same rules as aresearch().
+
+        Args:
+            query: The research question or topic
+            context_snapshot: Prior-turn messages this query starts from
+            max_iterations: Maximum number of agent-tool cycles
+
+        Returns:
+            Final state with messages and results
+        """
+        cache_key = None
+        if self.exec_cache and not context_snapshot:
+            cache_key = ExecutionCache.make_key(
+                self.config.model_name, self.config.user_level, query
+            )
+            cached = self.exec_cache.get(cache_key)
+            if cached is not None:
+                final_state = dict(cached)
+                final_state["messages"] = self._deserialize_messages(final_state["messages"])
+                return final_state
+
+        initial_messages = self._build_initial_messages(query, context_snapshot)
+        try:
+            if self.config.use_langgraph:
+                final_state = await self.graph.ainvoke(
+                    {
+                        "messages": initial_messages,
+                        "citations": [],
+                        "progress": 0,
+                        "tool_message_count": 0
+                    },
+                    config={"recursion_limit": max_iterations}
+                )
+            else:
+                final_state = await self._fast_research_loop(initial_messages, max_iterations)
+
+            if cache_key:
+                self.exec_cache.put(cache_key, {
+                    "messages": ConversationMemory._serialize_messages(final_state["messages"]),
+                    "citations": final_state.get("citations", []),
+                    "progress": final_state.get("progress", 0)
+                })
+            return final_state
+        except Exception as e:
+            error_msg = format_tool_error(e, "agent")
+            return {
+                "messages": initial_messages + [
+                    AIMessage(content=f"An error occurred: {error_msg}")
+                ],
+                "citations": [],
+                "progress": 0
+            }
+
+    async def abatch_research(self, queries: list, max_iterations: int = 10, concurrency: int = 8) -> list:
+        """
+        Run several independent research queries concurrently.
+
+        Every query starts from a snapshot of the current context taken
+        once at batch start and runs in parallel (bounded by
+        `concurrency`), overlapping LLM and tool I/O across queries.
+        Results are neither appended to the conversation context nor
+        saved to conversation memory — queries in a batch are unrelated,
+        and concurrent runs must not see each other's turns as context.
+        Best used on a fresh session (after new_chat()).
+
+        Args:
+            queries: Research questions to run
+            max_iterations: Maximum agent-tool cycles per query
+            concurrency: Maximum queries in flight at once
+
+        Returns:
+            Final states, in the same order as the input queries
+        """
+        context_snapshot = list(self.context_messages)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(query):
+            async with semaphore:
+                return await self._aresearch_detached(query, context_snapshot, max_iterations)
+
+        return await asyncio.gather(*(one(q) for q in queries))
+
+    def batch_research(self, queries: list, max_iterations: int = 10, concurrency: int = 8) -> list:
+        """Synchronous wrapper around abatch_research()."""
+        return asyncio.run(self.abatch_research(queries, max_iterations, concurrency))
+
+    def research(self, query: str, max_iterations: int = 10, bypass_cache: bool = False) -> dict:
+        """
+        Conduct research on a given query (synchronous wrapper).
+
+        Args:
+            query: The research question or topic
+            max_iterations: Maximum number of agent-tool cycles
+            bypass_cache: Skip the execution cache and force a fresh run
+
+        Returns:
+            Final state with messages and results
+        """
+        return asyncio.run(self.aresearch(query, max_iterations, bypass_cache))
+
+    def _save_in_background(self, query: str, answer: str, messages: list, citations: list) -> str:
+        """
+        Queue a conversation save on the background writer.
+
+        Pre-generates the conversation ID when starting a new session so
+        the caller learns it without waiting on the disk write.
+
+        Returns:
+            The active conversation ID
+        """
+        if self.active_conversation_id is None:
+            self.active_conversation_id = ConversationMemory.new_conversation_id()
+        conversation_id = self.active_conversation_id
+
+        # Drop finished saves so long sessions don't accumulate one
+        # completed future per turn; flush() still waits on what's left
+        if self._pending_saves:
+            self._pending_saves = [f for f in self._pending_saves if not f.done()]
+
+        future = self._save_pool.submit(
+            self.memory.save_conversation,
+            query=query,
+            answer=answer,
+            messages=messages,
+            citations=citations,
+            metadata={
+                "model": self.config.model_name,
+                "temperature": self.config.temperature,
+                "user_level": self.config.user_level
+            },
+            conversation_id=conversation_id
+        )
+        self._pending_saves.append(future)
+        return conversation_id
+
+    def flush(self) -> None:
+        """Block until all pending background conversation saves complete."""
+        if self._pending_saves:
+            concurrent.futures.wait(self._pending_saves)
+            self._pending_saves.clear()
+
+    def get_final_answer(self, state: dict) -> str:
+        """Extract the final answer from the state."""
+        messages = state.get("messages")
+        if not messages:
+            return "No answer generated."
+        # LangChain sets `type` as a class constant, so this is a plain
+        # attribute read instead of an isinstance walk over the hierarchy
+        last_message = messages[-1]
+        content = getattr(last_message, "content", None)
+        if content and getattr(last_message, "type", "") == "ai":
+            return content
+        return "No answer generated."
+    
+    async def astream_research(self, query: str):
+        """
+        Stream research results in real-time (async).
+
+        Args:
+            query: The research question or topic
+
+        Yields:
+            State updates as they occur
+        """
+        # Exact-match cache lookup, same rules as aresearch(): only valid
+        # on a fresh session. A hit skips the whole pipeline and yields a
+        # single final update, so repeated demo queries answer instantly.
+        cache_key = None
+        if self.exec_cache and not self.context_messages:
+            cache_key = ExecutionCache.make_key(
+                self.config.model_name, self.config.user_level, query
+            )
+            cached = self.exec_cache.get(cache_key)
+            if cached is not None:
+                final_state = dict(cached)
+                final_state["messages"] = self._deserialize_messages(final_state["messages"])
+                self.context_messages = self._new_context(final_state["messages"])
+                yield {"agent": final_state}
+                return
+
+        # Initialize state with windowed context messages, so prompt size
+        # stays bounded no matter how long the conversation runs
+        initial_messages = self._build_initial_messages(query, self.context_messages)
+
+        initial_state = {
+            "messages": initial_messages,
+            "citations": [],
+            "progress": 0,
+            "tool_message_count": 0
+        }
+
+        # Buffer message deltas as they stream by, so the post-stream save
+        # reuses them instead of re-walking the final state
+        buffered_messages = list(initial_messages)
+        final_update = None
+        async for update in self.graph.astream(initial_state):
+            node_state = next(iter(update.values()))
+            if node_state and "messages" in node_state:
+                buffered_messages.extend(node_state["messages"])
+            final_update = update
+            yield update
+
+        # Save conversation after streaming completes (background write);
+        # only this turn's new messages go to the save and the context
+        # buffer — the transcript already holds prior turns
+        if self.memory and final_update:
+            last_node_state = next(iter(final_update.values()))
+            if last_node_state:
+                answer = self.get_final_answer(last_node_state)
+                new_messages = buffered_messages[len(initial_messages) - 1:]
+                self._save_in_background(
+                    query, answer, new_messages, last_node_state.get("citations", [])
+                )
+                self.context_messages.extend(new_messages)
+
+        # Populate the execution cache so the next identical fresh-session
+        # query (streamed or not) is served from disk
+        if cache_key and final_update:
+            last_node_state = next(iter(final_update.values()))
+            if last_node_state:
+                self.exec_cache.put(cache_key, {
+                    "messages": ConversationMemory._serialize_messages(buffered_messages),
+                    "citations": last_node_state.get("citations", []),
+                    "progress": last_node_state.get("progress", 0)
+                })
+
+    async def astream_tokens(self, query: str):
+        """
+        Stream final-answer tokens as they are generated.
+
+        Unlike astream_research (which yields node-level state updates),
+        this yields raw content chunks from the LLM, suitable for showing
+        the answer as it is written. Conversation memory is not updated.
+
+        Args:
+            query: The research question or topic
+
+        Yields:
+            Content chunks from the LLM as they arrive
+        """
+        initial_messages = self._build_initial_messages(query, self.context_messages)
+
+        initial_state = {
+            "messages": initial_messages,
+            "citations": [],
+            "progress": 0,
+            "tool_message_count": 0
+        }
+
+        async for event in self.graph.astream_events(initial_state, version="v2"):
+            if event.get("event") == "on_chat_model_stream":
+                content = getattr(event["data"].get("chunk"), "content", "")
+                if content:
+                    yield content
+
+    def stream_research(self, query: str):
+        """
+        Stream research results in real-time (synchronous wrapper).
+
+        Args:
+            query: The research question or topic
+
+        Yields:
+            State updates as they occur
+        """
+        stream = self.astream_research(query)
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(stream.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            # Finalize the async generator while the loop is still alive:
+            # a consumer that breaks out early leaves it suspended, and
+            # letting the interpreter finalize it later — against a closed
+            # loop — raises "event loop is closed" warnings and never
+            # releases the underlying graph stream
+            try:
+                loop.run_until_complete(stream.aclose())
+            finally:
+                loop.close()
+
+    def get_conversation_history(self, limit: int = 50) -> list:
+        """Get list of saved conversations."""
+        if not self.memory:
+            return []
+        return self.memory.list_conversations(limit)
+    
+    def load_conversation(self, conversation_id: str) -> dict:
+        """Load a specific conversation by ID."""
+        if not self.memory:
+            return None
+        return self.memory.load_conversation(conversation_id)
+    
+    def delete_conversation(self, conversation_id: str) -> bool:
+        """Delete a conversation by ID."""
+        if not self.memory:
+            return False
+        return self.memory.delete_conversation(conversation_id)
+    
+    def new_chat(self) -> None:
+        """Start a new conversation session. Next queries will create a new conversation file."""
+        self.active_conversation_id = None
+        self.context_messages.clear()  # Clear conversation context
+    
+    def load_chat(self, conversation_id: str) -> bool:
+        """Load a previous conversation and continue from it.
+        
+        Args:
+            conversation_id: The conversation ID to load
+        
+        Returns:
+            True if loaded successfully, False otherwise
+        """
+        if not self.memory:
+            return False
+        
+        conv = self.memory.load_conversation(conversation_id)
+        if conv:
+            self.active_conversation_id = conversation_id
+            # Load messages from saved conversation
+            if "messages" in conv and conv["messages"]:
+                # Reconstruct message objects from serialized data
+                self.context_messages = self._new_context(self._deserialize_messages(conv["messages"]))
+            else:
+                self.context_messages = self._new_context()
+            return True
+        return False
+    
+    # Dispatch table for message reconstruction; ToolMessage is deliberately
+    # absent as tool results are not needed for context
+    _MSG_CTORS = {
+        "SystemMessage": SystemMessage,
+        "HumanMessage": HumanMessage,
+        "AIMessage": AIMessage,
+    }
+
+    async def aload_chat(self, conversation_id: str) -> bool:
+        """
+        Load a previous conversation while pre-warming the LLM connection.
+
+        The disk read and a one-token warm-up generation run concurrently,
+        so the first research() after loading doesn't also pay connection
+        and model spin-up time.
+
+        Args:
+            conversation_id: The conversation ID to load
+
+        Returns:
+            True if loaded successfully, False otherwise
+        """
+        if not self.memory:
+            return False
+
+        conv, _ = await asyncio.gather(
+            asyncio.to_thread(self.memory.load_conversation, conversation_id),
+            self.llm.ainvoke([HumanMessage(content="ping")], num_predict=1),
+            return_exceptions=True  # a failed warm-up must not fail the load
+        )
+        if isinstance(conv, Exception) or not conv:
+            return False
+
+        self.active_conversation_id = conversation_id
+        serialized = conv.get("messages") or []
+        if serialized:
+            # Deserialization of long histories runs off the event loop
+            messages = await asyncio.to_thread(self._deserialize_messages, serialized)
+            self.context_messages = self._new_context(messages)
+        else:
+            self.context_messages = self._new_context()
+        return True
+
+    def _deserialize_messages(self, serialized_messages: list) -> list:
+        """Reconstruct message objects from serialized data."""
+        # Fast path: already message instances (e.g. from a warm cache)
+        if serialized_messages and not isinstance(serialized_messages[0], dict):
+            return list(serialized_messages)
+
+        ctors = self._MSG_CTORS
+        return [
+            ctors[msg["type"]](content=msg.get("content", ""))
+            for msg in serialized_messages
+            if msg.get("type") in ctors
+        ]
+    
+    def get_active_conversation_id(self) -> str:
+        """Get the current active conversation ID."""
+        return self.active_conversation_id
+
+
+# Convenience function for quick usage
+def create_agent(
+    model_name: str = "gpt-oss:120b-cloud",
+    temperature: float = 0.3,
+    user_level: str = "general"
+) -> ResearchProAgent:
+    """
+    Create a ResearchPro Agent with custom configuration.
+    
+    Args:
+        model_name: Ollama model to use (default: gpt-oss:120b-cloud)
+        temperature: LLM temperature (0.0-1.0)
+        user_level: User expertise level ("expert", "beginner", "general")
+    
+    Returns:
+        Configured ResearchProAgent instance
+    """
+    config = AgentConfig(
+        model_name=model_name,
+        temperature=temperature,
+        user_level=user_level
+    )
+    return ResearchProAgent(config)
+
+
+if __name__ == "__main__":
+    # Quick test
+    print("🔬 ResearchPro Agent initialized!")
+    print("📚 Tools available:", len(ResearchProAgent.default_tools()))
+    print("\nTo use the agent:")
+    print("  from researchpro.agent import create_agent")
+    print("  agent = create_agent()")
+    print("  result = agent.research('Your question here')")
+    print("  print(agent.get_final_answer(result))")
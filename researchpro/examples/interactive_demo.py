@@ -3,21 +3,39 @@ Example 3: Interactive Demo with Streaming
 Demonstrates real-time streaming of agent reasoning.
 """
 
+import functools
 import sys
-import os
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BAR = "=" * 70
 
-from agent import create_agent
+# REPL command aliases, matched against the lowercased input
+QUIT_COMMANDS = frozenset({'quit', 'exit', 'q'})
+NEW_CHAT_COMMANDS = frozenset({'new', 'new chat', 'newchat'})
+
+
+@functools.lru_cache(maxsize=32)
+def _banner(text: str) -> str:
+    """Build (and cache) the centered banner for a title."""
+    return f"\n{BAR}\n{text.center(70)}\n{BAR}\n\n"
 
 
 def print_header(text: str):
     """Print a formatted header."""
-    print()
-    print("=" * 70)
-    print(text.center(70))
-    print("=" * 70)
-    print()
+    sys.stdout.write(_banner(text))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_agent(temperature: float, user_level: str):
+    """
+    Build (and reuse) an agent for the given settings.
+
+    The LangChain/LangGraph stack is imported here instead of at module
+    level, so `--help`-style invocations and startup stay fast, and both
+    demo modes share one agent per configuration.
+    """
+    from researchpro.agent import create_agent
+
+    return create_agent(temperature=temperature, user_level=user_level)
 
 
 def main():
@@ -25,7 +43,7 @@ def main():
     
     # Create agent
     print("🔧 Initializing agent with streaming enabled...")
-    agent = create_agent(temperature=0.4, user_level="general")
+    agent = _get_agent(temperature=0.4, user_level="general")
     print("✅ Agent ready!")
     print()
     
@@ -47,17 +65,20 @@ def main():
         
         if not query:
             continue
-        
-        if query.lower() in ['quit', 'exit', 'q']:
+
+        # Lowercase once; every command check below reuses it
+        ql = query.lower()
+
+        if ql in QUIT_COMMANDS:
             print("\n👋 Goodbye!")
             break
-        
-        if query.lower() in ['new', 'new chat', 'newchat']:
+
+        if ql in NEW_CHAT_COMMANDS:
             agent.new_chat()
             print("\n✨ Started new conversation!\n")
             continue
-        
-        if query.lower() == 'list':
+
+        if ql == 'list':
             history = agent.get_conversation_history()
             if not history:
                 print("\n📭 No saved conversations yet.\n")
@@ -73,7 +94,7 @@ def main():
                 print()
             continue
         
-        if query.lower().startswith('load '):
+        if ql.startswith('load '):
             conv_identifier = query[5:].strip()
             
             # Check if it's a number (list index) or conversation ID
@@ -107,29 +128,36 @@ def main():
         print("-" * 70)
         print()
         
-        # Stream the research process
+        # Stream the research process. Output for each step is buffered and
+        # written in one call instead of one syscall per print().
         step_count = 0
         final_state = None
         for state_update in agent.stream_research(query):
             step_count += 1
-            
-            # Extract the node that was just executed
-            node_name = list(state_update.keys())[0]
-            state = state_update[node_name]
+            lines = []
+
+            # Extract the node that was just executed (one dict pass,
+            # no throwaway key list)
+            node_name, state = next(iter(state_update.items()))
             final_state = state  # Keep track of final state
-            
+
             if node_name == "agent":
-                last_msg = state["messages"][-1] if state.get("messages") else None
+                msgs = state.get("messages")
+                last_msg = msgs[-1] if msgs else None
                 if last_msg and hasattr(last_msg, "tool_calls") and last_msg.tool_calls:
-                    print(f"  🔧 Step {step_count}: Calling {len(last_msg.tool_calls)} tool(s)...")
+                    lines.append(f"  🔧 Step {step_count}: Calling {len(last_msg.tool_calls)} tool(s)...")
                     for tool_call in last_msg.tool_calls:
                         tool_name = tool_call.get("name", "unknown")
-                        print(f"     └─ {tool_name}")
+                        lines.append(f"     └─ {tool_name}")
                 else:
-                    print(f"  💭 Step {step_count}: Generating final answer...")
-            
+                    lines.append(f"  💭 Step {step_count}: Generating final answer...")
+
             elif node_name == "tools":
-                print(f"  ✅ Step {step_count}: Tools executed")
+                lines.append(f"  ✅ Step {step_count}: Tools executed")
+
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
         
         # Get final answer from the streamed state
         print()
@@ -154,7 +182,7 @@ def run_preset_demo():
     """Run a preset demo with predefined questions."""
     print_header("🎬 ResearchPro Agent - Preset Demo")
     
-    agent = create_agent(temperature=0.3, user_level="general")
+    agent = _get_agent(temperature=0.3, user_level="general")
     
     questions = [
         "What is machine learning?",
@@ -162,20 +190,17 @@ def run_preset_demo():
         "What are the top 3 benefits of meditation according to research?"
     ]
     
-    for i, question in enumerate(questions, 1):
+    # Run all questions concurrently instead of one pipeline after another
+    print(f"\n🚀 Researching {len(questions)} questions in parallel...")
+    results = agent.batch_research(questions, max_iterations=10)
+
+    for i, (question, result) in enumerate(zip(questions, results), 1):
         print(f"\n📝 Question {i}/{len(questions)}: {question}")
         print("-" * 70)
-        
-        result = agent.research(question, max_iterations=10)
-        answer = agent.get_final_answer(result)
-        
         print()
-        print(answer)
+        print(agent.get_final_answer(result))
         print()
         print("=" * 70)
-        
-        if i < len(questions):
-            input("\nPress Enter to continue to next question...")
 
 
 if __name__ == "__main__":
@@ -4,12 +4,14 @@ Middleware module for the ResearchPro Agent.
 
 from .helpers import (
     trim_messages_middleware,
+    window_context_messages,
     get_dynamic_system_prompt,
     format_tool_error
 )
 
 __all__ = [
     "trim_messages_middleware",
+    "window_context_messages",
     "get_dynamic_system_prompt",
     "format_tool_error"
 ]
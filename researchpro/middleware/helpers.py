@@ -0,0 +1,175 @@
+"""
+Middleware components for the ResearchPro Agent.
+Handles message management, error handling, and dynamic prompts.
+"""
+
+import functools
+import re
+from typing import Dict, Any, Optional
+
+
+def trim_messages_middleware(state: Dict[str, Any], max_messages: int = 20) -> Optional[Dict[str, Any]]:
+    """
+    Trim conversation history to prevent context overflow.
+    
+    Keeps the system prompt and the most recent messages.
+    
+    Args:
+        state: Current agent state
+        max_messages: Maximum number of messages to keep
+    
+    Returns:
+        Updated state with trimmed messages, or None if no trimming needed
+    """
+    messages = state.get("messages", [])
+
+    if len(messages) <= max_messages:
+        return None
+
+    # Keep system message (first) + last N messages. A tail slice copies
+    # only the k kept messages; anything that walks the full list (e.g. a
+    # bounded deque fed all N messages) scales with history length instead.
+    system_msg = messages[0] if messages and messages[0].get("role") == "system" else None
+    if system_msg:
+        trimmed_messages = [system_msg] + messages[-(max_messages - 1):]
+    else:
+        trimmed_messages = messages[-max_messages:]
+
+    return {"messages": trimmed_messages}
+
+
+def window_context_messages(messages: list, max_turns: int = 6) -> list:
+    """
+    Bound conversation context to the most recent turns.
+
+    Keeps the leading system message (if any) plus the last `max_turns`
+    human/AI exchanges, so the prompt re-sent to the LLM stays O(k)
+    regardless of how long the conversation grows.
+
+    Args:
+        messages: List of message objects from prior turns
+        max_turns: Number of recent exchanges to keep
+
+    Returns:
+        Windowed list of messages (the input is not modified)
+    """
+    messages = list(messages)  # accept any sequence, e.g. a deque
+    if not messages:
+        return []
+
+    # Keep the system message separate from the windowed turns
+    system_msg = messages[0] if getattr(messages[0], "type", None) == "system" else None
+    rest = messages[1:] if system_msg else messages
+
+    # One turn is a human message plus the AI (and tool) messages that
+    # follow — tool-calling turns span four or more messages, so the cut
+    # must land on a human message: a window starting with an orphaned
+    # tool result (its tool-calling AI message trimmed away) is rejected
+    # by chat endpoints
+    turn_starts = [
+        i for i, msg in enumerate(rest)
+        if getattr(msg, "type", None) == "human"
+    ]
+    recent = rest[turn_starts[-max_turns]:] if len(turn_starts) > max_turns else rest
+
+    # The bounded context buffer can itself trim mid-turn; drop any
+    # leading tool results whose calling message is already gone
+    while recent and getattr(recent[0], "type", None) == "tool":
+        recent = recent[1:]
+
+    if system_msg:
+        return [system_msg] + recent
+    return recent
+
+
+# Built once at import; get_dynamic_system_prompt returns the same interned
+# string per level, which also keeps the prompt prefix byte-stable for
+# backend prompt caching
+_BASE_PROMPT = """You are ResearchPro, an expert research assistant with extensive knowledge.
+
+IMPORTANT INSTRUCTIONS:
+1. First, try to answer using your built-in knowledge
+2. Use web_search ONLY when you need current information, specific data, or verification
+3. Use scrape_webpage ONLY when the user provides a specific URL to analyze
+4. After using a tool ONCE, provide your final comprehensive answer immediately
+5. DO NOT call multiple tools in sequence - one tool call is enough
+
+Available Tools:
+- web_search: Search for current information online (use for recent events, statistics, comparisons)
+- scrape_webpage: Extract content from a specific URL (use only when user provides a URL)
+
+Output Format Requirements:
+- Write in clean, plain text format suitable for terminal display
+- NO markdown tables (|, --, etc.) - use simple aligned text instead
+- NO asterisks for bold (**text**) - use UPPERCASE or simple emphasis
+- Structure with clear headings using numbers or bullets
+- Use indentation and spacing for readability
+- Include sources when you used web_search
+- Be comprehensive but well-organized
+
+Example of good formatting:
+  COMPARISON: Honda vs Toyota
+  
+  1. Overview
+     Honda: 4.3M units sold, focuses on sporty cars
+     Toyota: 10.5M units sold, broadest lineup
+  
+  2. Reliability
+     Honda: 73/100 score, good CVT issues
+     Toyota: 84/100 score, top-rated
+
+"""
+
+_STYLE_SUFFIXES = {
+    "expert": "\nCommunication Style: Use technical terminology and detailed analysis. Assume advanced knowledge.",
+    "beginner": "\nCommunication Style: Explain concepts in simple terms with examples. Avoid jargon.",
+    "general": "\nCommunication Style: Professional, objective, and informative. Balance technical accuracy with accessibility."
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_dynamic_system_prompt(user_level: str = "general") -> str:
+    """
+    Generate system prompt based on user expertise level.
+
+    Args:
+        user_level: User expertise level ("expert", "beginner", "general")
+
+    Returns:
+        Customized system prompt
+    """
+    return _BASE_PROMPT + _STYLE_SUFFIXES.get(user_level, _STYLE_SUFFIXES["general"])
+
+
+# One case-insensitive pass classifies the error without lowercasing the
+# whole (possibly stack-trace-sized) message first
+_ERROR_PATTERN = re.compile(
+    r"(?P<timeout>timeout)|(?P<notfound>not found)|(?P<permission>permission)",
+    re.IGNORECASE
+)
+
+_ERROR_TEMPLATES = {
+    "timeout": "The {tool_name} tool timed out. Please try again or use a different approach.",
+    "notfound": "The {tool_name} tool couldn't find the requested resource. Please check the input and try again.",
+    "permission": "The {tool_name} tool doesn't have permission to access the resource. Please check permissions.",
+}
+
+
+def format_tool_error(error: Exception, tool_name: str) -> str:
+    """
+    Format tool error messages in a user-friendly way.
+
+    Args:
+        error: The exception that occurred
+        tool_name: Name of the tool that failed
+
+    Returns:
+        Formatted error message
+    """
+    error_msg = str(error)
+
+    # Provide helpful error messages
+    match = _ERROR_PATTERN.search(error_msg)
+    if match:
+        return _ERROR_TEMPLATES[match.lastgroup].format(tool_name=tool_name)
+    return f"The {tool_name} tool encountered an error: {error_msg}. Please try an alternative approach."
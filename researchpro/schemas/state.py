@@ -0,0 +1,26 @@
+"""State schemas for the ResearchPro Agent."""
+
+from typing import List, Dict, Annotated
+from typing_extensions import TypedDict
+from operator import add
+
+
+def merge_citations(old: List[Dict], new: List[Dict]) -> List[Dict]:
+    """
+    Reducer that accumulates citations deduplicated by URL.
+
+    Tools often re-emit the same source across iterations; plain list
+    concatenation grows unbounded, while a dict keyed on URL keeps the
+    merge O(n) and memory bounded by unique sources.
+    """
+    seen = {c.get("url", id(c)): c for c in old}
+    seen.update({c.get("url", id(c)): c for c in new})
+    return list(seen.values())
+
+
+class ResearchState(TypedDict):
+    """State schema for the agent with message accumulation."""
+    messages: Annotated[List, add]  # Messages accumulate
+    citations: Annotated[List[Dict], merge_citations]  # Unique by source URL
+    progress: int  # Progress counter
+    tool_message_count: Annotated[int, add]  # Tool results so far (incremental)
@@ -0,0 +1,15 @@
+"""Tools package initialization."""
+
+from .search import web_search
+from .scraper import scrape_webpage, scrape_urls_batch
+from .calculator import calculate, percentage_change, compound_growth_rate, compound_growth_rate_batch
+
+__all__ = [
+    "web_search",
+    "scrape_webpage",
+    "scrape_urls_batch",
+    "calculate",
+    "percentage_change",
+    "compound_growth_rate",
+    "compound_growth_rate_batch",
+]
@@ -0,0 +1,19 @@
+"""
+Shared HTTP session for the web tools.
+
+One pooled session keeps TCP/TLS connections alive between tool calls,
+so repeated requests to the same host skip the handshake entirely.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+SESSION = requests.Session()
+SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept-Encoding": "gzip, deflate",
+})
+
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
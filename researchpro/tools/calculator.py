@@ -0,0 +1,289 @@
+"""
+Calculator tools for the ResearchPro Agent.
+Provides safe math evaluation and common research calculations.
+"""
+
+from langchain.tools import tool
+import ast
+import math
+import types
+from functools import lru_cache
+
+import numpy as np
+import orjson
+
+
+def _dumps(obj: dict, pretty: bool = False) -> str:
+    """Serialize a tool response with orjson (much faster than stdlib json)."""
+    option = orjson.OPT_INDENT_2 if pretty else 0
+    return orjson.dumps(obj, option=option).decode()
+
+
+# Names the evaluator may resolve; everything else is rejected at parse time.
+# Read-only view so nothing can inject names into the sandbox at runtime.
+_SAFE_FUNCS = types.MappingProxyType({
+    'abs': abs,
+    'round': round,
+    'min': min,
+    'max': max,
+    'len': len,
+    'sum': lambda x: float(np.sum(x)),
+    'pow': pow,
+    'sqrt': math.sqrt,
+    'log': math.log,
+    'log10': math.log10,
+    'exp': math.exp,
+    'floor': math.floor,
+    'ceil': math.ceil,
+    # Vectorized reductions; float() so the JSON serializer sees native numbers
+    'mean': lambda x: float(np.mean(x)),
+    'median': lambda x: float(np.median(x)),
+    'stdev': lambda x: float(np.std(x, ddof=1)),
+    'pi': math.pi,
+    'e': math.e,
+})
+
+# Shared globals for eval(); built once instead of per call
+_EVAL_GLOBALS = {"__builtins__": {}}
+
+# Structural node types allowed in expressions (operators, literals, lists)
+_ALLOWED_NODES = (
+    ast.Expression, ast.Constant, ast.BinOp, ast.UnaryOp, ast.Call,
+    ast.Name, ast.Load, ast.List, ast.Tuple,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.USub, ast.UAdd,
+)
+
+
+@lru_cache(maxsize=512)
+def _compile_expr(expression: str):
+    """
+    Parse, validate, and compile an expression to a code object.
+
+    The result is cached per expression text, so repeated identical
+    expressions (common when the LLM retries a calculation) skip the
+    tokenize/parse/compile work entirely.
+
+    Args:
+        expression: Normalized expression text
+
+    Returns:
+        Compiled code object ready for eval()
+
+    Raises:
+        ValueError: If the expression uses anything outside the safe subset
+        SyntaxError: If the expression is not valid Python syntax
+    """
+    tree = ast.parse(expression, mode="eval")
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in _SAFE_FUNCS:
+                raise ValueError("Only whitelisted functions are allowed")
+        elif isinstance(node, ast.Name):
+            if node.id not in _SAFE_FUNCS:
+                raise ValueError(f"Name not allowed: {node.id}")
+        elif not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Expression element not allowed: {type(node).__name__}")
+
+    return compile(tree, "<calculate>", "eval")
+
+
+@lru_cache(maxsize=1024)
+def _calculate_impl(expression: str) -> str:
+    """
+    Evaluate a normalized expression, caching the full JSON response.
+
+    The tools are pure functions of their arguments and agent workloads
+    repeat tool invocations heavily, so an exact-key cache skips eval and
+    JSON encoding on repeats.
+    """
+    try:
+        code = _compile_expr(expression)
+        result = eval(code, _EVAL_GLOBALS, _SAFE_FUNCS)
+
+        return _dumps({
+            "status": "success",
+            "expression": expression,
+            "result": result
+        }, pretty=True)
+
+    except ZeroDivisionError:
+        return _dumps({
+            "status": "error",
+            "message": "Division by zero",
+            "expression": expression
+        })
+    except (ValueError, SyntaxError) as e:
+        return _dumps({
+            "status": "error",
+            "message": f"Invalid expression: {str(e)}",
+            "expression": expression
+        })
+    except Exception as e:
+        return _dumps({
+            "status": "error",
+            "message": f"Calculation failed: {str(e)}",
+            "expression": expression
+        })
+
+
+@tool
+def calculate(expression: str) -> str:
+    """
+    Evaluate a mathematical expression safely.
+
+    Supports arithmetic operators, common math functions (sqrt, log, exp,
+    floor, ceil) and statistics over lists (mean, median, stdev, sum).
+    Useful for growth rates, percentages, and quick numeric checks.
+
+    Args:
+        expression (str): The expression to evaluate
+
+    Returns:
+        str: JSON string with the expression and its result
+
+    Examples:
+        >>> calculate("sqrt(144) + 10")
+        >>> calculate("mean([4, 8, 15, 16, 23, 42])")
+        >>> calculate("(250 / 100) ** (1 / 5) - 1")
+    """
+    return _calculate_impl(" ".join(expression.split()))
+
+
+@lru_cache(maxsize=1024)
+def _percentage_change_impl(old_value: float, new_value: float) -> str:
+    try:
+        if old_value == 0:
+            return _dumps({
+                "status": "error",
+                "message": "Old value cannot be zero"
+            })
+
+        change = (new_value - old_value) / old_value * 100
+
+        return _dumps({
+            "status": "success",
+            "old_value": old_value,
+            "new_value": new_value,
+            "percentage_change": round(change, 4)
+        }, pretty=True)
+
+    except Exception as e:
+        return _dumps({
+            "status": "error",
+            "message": f"Calculation failed: {str(e)}"
+        })
+
+
+@tool
+def percentage_change(old_value: float, new_value: float) -> str:
+    """
+    Calculate the percentage change between two values.
+
+    Args:
+        old_value (float): The starting value
+        new_value (float): The ending value
+
+    Returns:
+        str: JSON string with the percentage change
+
+    Example:
+        >>> percentage_change(100, 250)
+    """
+    return _percentage_change_impl(old_value, new_value)
+
+
+@lru_cache(maxsize=1024)
+def _compound_growth_rate_impl(start_value: float, end_value: float, periods: float) -> str:
+    try:
+        if start_value <= 0 or periods <= 0:
+            return _dumps({
+                "status": "error",
+                "message": "Start value and periods must be positive"
+            })
+
+        rate = (end_value / start_value) ** (1 / periods) - 1
+
+        return _dumps({
+            "status": "success",
+            "start_value": start_value,
+            "end_value": end_value,
+            "periods": periods,
+            "growth_rate_percent": round(rate * 100, 4)
+        }, pretty=True)
+
+    except Exception as e:
+        return _dumps({
+            "status": "error",
+            "message": f"Calculation failed: {str(e)}"
+        })
+
+
+@tool
+def compound_growth_rate(start_value: float, end_value: float, periods: float) -> str:
+    """
+    Calculate the compound annual growth rate (CAGR).
+
+    Args:
+        start_value (float): Value at the start of the period
+        end_value (float): Value at the end of the period
+        periods (float): Number of periods (usually years)
+
+    Returns:
+        str: JSON string with the growth rate as a percentage
+
+    Example:
+        >>> compound_growth_rate(100, 250, 5)
+    """
+    return _compound_growth_rate_impl(start_value, end_value, periods)
+
+
+@tool
+def compound_growth_rate_batch(start_values: list, end_values: list, periods: float) -> str:
+    """
+    Calculate compound growth rates for many value pairs at once.
+
+    The whole batch is computed in one vectorized NumPy expression, so
+    spreadsheet-style workloads don't pay interpreter overhead per row.
+
+    Args:
+        start_values (list): Values at the start of the period
+        end_values (list): Values at the end of the period, same length
+        periods (float): Number of periods (usually years)
+
+    Returns:
+        str: JSON string with one growth rate percentage per pair
+
+    Example:
+        >>> compound_growth_rate_batch([100, 50], [250, 75], 5)
+    """
+    try:
+        starts = np.asarray(start_values, dtype=np.float64)
+        ends = np.asarray(end_values, dtype=np.float64)
+
+        if starts.shape != ends.shape:
+            return _dumps({
+                "status": "error",
+                "message": "start_values and end_values must have the same length"
+            })
+        if periods <= 0 or starts.size == 0 or np.any(starts <= 0):
+            return _dumps({
+                "status": "error",
+                "message": "Start values and periods must be positive"
+            })
+
+        rates = (ends / starts) ** (1.0 / periods) - 1.0
+
+        return _dumps({
+            "status": "success",
+            "periods": periods,
+            "count": int(starts.size),
+            "growth_rates_percent": [round(float(r), 4) for r in rates * 100]
+        }, pretty=True)
+
+    except Exception as e:
+        return _dumps({
+            "status": "error",
+            "message": f"Calculation failed: {str(e)}"
+        })
@@ -0,0 +1,316 @@
+"""
+Web scraping tool for extracting content from webpages.
+"""
+
+from langchain.tools import tool
+import asyncio
+import requests
+import os
+import time
+from functools import lru_cache
+from urllib.parse import urlparse, urlsplit
+
+import httpx
+import orjson
+from lxml import etree
+from lxml import html as lxml_html
+
+from ._http import SESSION
+
+
+# Pretty-print tool JSON only when debugging; compact output is faster
+# to encode and costs the LLM fewer tokens to read back
+_INDENT = 2 if os.getenv("TOOL_DEBUG") else None
+
+def _dumps(obj: dict) -> str:
+    """Serialize a tool response with orjson (much faster than stdlib json)."""
+    option = orjson.OPT_INDENT_2 if _INDENT else 0
+    return orjson.dumps(obj, option=option).decode()
+
+
+# Cached responses (including errors) live at most this long; the TTL
+# bucket in the cache key rolls them over without a background sweeper
+_CACHE_TTL = 600
+
+# Stop reading a page after this many bytes; only ~max_length chars
+# survive extraction anyway, so huge pages shouldn't cost memory or
+# parse time proportional to their full size
+_MAX_BYTES = 2_000_000
+
+
+def _extract_content(page_bytes: bytes, max_length: int) -> tuple:
+    """
+    Pull the title and main text out of raw HTML bytes.
+
+    Shared by scrape_webpage and scrape_urls_batch so both tools apply
+    identical extraction rules.
+
+    Returns:
+        (title, content) strings; content is truncated to max_length
+    """
+    # Parse straight into an lxml tree; raw bytes let libxml2 handle
+    # encoding detection in one pass
+    tree = lxml_html.fromstring(page_bytes)
+
+    # Remove unwanted elements in C instead of a per-node Python loop
+    etree.strip_elements(
+        tree, 'script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe',
+        with_tail=False
+    )
+
+    # Extract title (lxml elements are falsy when empty, so compare
+    # against None explicitly)
+    title = tree.find('.//title')
+    title_text = title.text.strip() if title is not None and title.text else "No title"
+
+    # Extract main content
+    # Try to find main content areas
+    main_content = tree.find('.//main')
+    if main_content is None:
+        main_content = tree.find('.//article')
+    if main_content is None:
+        hits = tree.xpath(
+            "//div[@class='content' or @class='main-content'"
+            " or @class='post-content' or @class='article-content']"
+        )
+        main_content = hits[0] if hits else None
+    if main_content is None:
+        main_content = tree.find('.//body')
+
+    # Get text content; text_content() concatenates descendants at
+    # C speed, with no per-element tag objects
+    if main_content is not None:
+        content_parts = []
+        for elem in main_content.iter('p', 'h1', 'h2', 'h3', 'h4', 'li'):
+            text = elem.text_content().strip()
+            if len(text) > 20:  # Filter out very short text
+                content_parts.append(text)
+        content = "\n\n".join(content_parts)
+    else:
+        content = tree.text_content().strip()
+
+    # Truncate if needed
+    if len(content) > max_length:
+        content = content[:max_length] + "... [Content truncated]"
+
+    return title_text, content
+
+
+@lru_cache(maxsize=128)
+def _scrape_impl(url: str, max_length: int, _bucket: int) -> str:
+    """
+    Fetch and extract one page, caching the full JSON response.
+
+    Agents often revisit the same URL while refining a plan; the LRU
+    serves those repeats without touching the network. `_bucket` changes
+    every _CACHE_TTL seconds, so entries expire naturally.
+    """
+    try:
+        # Validate URL
+        parsed = urlparse(url)
+        if not all([parsed.scheme, parsed.netloc]):
+            return _dumps({
+                "status": "error",
+                "message": "Invalid URL format",
+                "url": url
+            })
+        
+        # Fetch webpage over the pooled session (keep-alive + gzip),
+        # streaming so the read stops at the byte cap; lxml parses
+        # truncated documents fine
+        response = SESSION.get(url, timeout=15, stream=True)
+        try:
+            response.raise_for_status()
+            page_bytes = response.raw.read(_MAX_BYTES, decode_content=True)
+        finally:
+            response.close()
+
+        title_text, content = _extract_content(page_bytes, max_length)
+
+        return _dumps({
+            "status": "success",
+            "url": url,
+            "title": title_text,
+            "content_length": len(content),
+            "content": content
+        })
+        
+    except requests.Timeout:
+        return _dumps({
+            "status": "error",
+            "message": "Request timed out",
+            "url": url
+        })
+    except requests.RequestException as e:
+        return _dumps({
+            "status": "error",
+            "message": f"Failed to fetch webpage: {str(e)}",
+            "url": url
+        })
+    except Exception as e:
+        return _dumps({
+            "status": "error",
+            "message": f"Scraping failed: {str(e)}",
+            "url": url
+        })
+
+
+@tool
+def scrape_webpage(url: str, max_length: int = 5000) -> str:
+    """
+    Extract main text content from a webpage.
+
+    This tool fetches a webpage and extracts the main textual content,
+    removing navigation, ads, and other non-essential elements. Useful
+    for reading articles, blog posts, and documentation.
+
+    Args:
+        url (str): The URL of the webpage to scrape
+        max_length (int): Maximum length of content to return (default: 5000 chars)
+
+    Returns:
+        str: Extracted text content from the webpage
+
+    Examples:
+        >>> scrape_webpage("https://example.com/article")
+        >>> scrape_webpage("https://blog.example.com/post", max_length=3000)
+    """
+    return _scrape_impl(url, max_length, int(time.time() // _CACHE_TTL))
+
+
+async def _scrape_urls_async(urls: list, max_length: int, concurrency: int = 10) -> list:
+    """Fetch and extract several URLs concurrently with a bounded semaphore."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(
+        headers=dict(SESSION.headers), timeout=15.0, follow_redirects=True
+    ) as client:
+
+        async def fetch_one(url: str) -> dict:
+            async with semaphore:
+                try:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    title_text, content = _extract_content(response.content, max_length)
+                    return {
+                        "status": "success",
+                        "url": url,
+                        "title": title_text,
+                        "content_length": len(content),
+                        "content": content
+                    }
+                except Exception as e:
+                    return {
+                        "status": "error",
+                        "message": f"Failed to fetch webpage: {str(e)}",
+                        "url": url
+                    }
+
+        return list(await asyncio.gather(*(fetch_one(u) for u in urls)))
+
+
+@tool
+def scrape_urls_batch(urls: list, max_length: int = 5000) -> str:
+    """
+    Extract main text content from several webpages at once.
+
+    Pages are fetched concurrently, so total time is roughly the slowest
+    single page instead of the sum of all of them. Use this after
+    extract_links or web_search when multiple sources need reading.
+
+    Args:
+        urls (list): The URLs of the webpages to scrape
+        max_length (int): Maximum content length per page (default: 5000 chars)
+
+    Returns:
+        str: JSON string with one result per URL, in input order
+
+    Example:
+        >>> scrape_urls_batch(["https://example.com/a", "https://example.com/b"])
+    """
+    try:
+        results = asyncio.run(_scrape_urls_async(urls, max_length))
+        return _dumps({
+            "status": "success",
+            "count": len(results),
+            "results": results
+        })
+    except Exception as e:
+        return _dumps({
+            "status": "error",
+            "message": f"Batch scraping failed: {str(e)}"
+        })
+
+
+@tool
+def extract_links(url: str, link_type: str = "all") -> str:
+    """
+    Extract links from a webpage.
+    
+    Args:
+        url (str): The URL to extract links from
+        link_type (str): Type of links to extract: "all", "internal", or "external"
+    
+    Returns:
+        str: JSON list of links found on the page
+    
+    Example:
+        >>> extract_links("https://example.com", link_type="internal")
+    """
+    try:
+        response = SESSION.get(url, timeout=15)
+        response.raise_for_status()
+        
+        tree = lxml_html.fromstring(response.content)
+        parsed_base = urlsplit(url)
+        base_domain = parsed_base.netloc
+        # Built once; every link below is classified with cheap prefix
+        # checks instead of a urlsplit allocation per anchor
+        prefix = f"{parsed_base.scheme}://{base_domain}"
+        internal_starts = (prefix + '/', prefix + '?', prefix + '#')
+
+        links = []
+        # XPath keeps the anchor scan inside libxml2; no BS4 tag objects
+        for a_tag in tree.xpath('//a[@href]'):
+            href = a_tag.get('href')
+
+            # Skip anchors and javascript
+            if href.startswith('#') or href.startswith('javascript:'):
+                continue
+
+            # Make absolute URL
+            if href.startswith('http'):
+                full_url = href
+            elif href.startswith('/'):
+                full_url = prefix + href
+            else:
+                continue
+
+            is_internal = full_url == prefix or full_url.startswith(internal_starts)
+
+            # Filter by type
+            if link_type == "internal" and not is_internal:
+                continue
+            if link_type == "external" and is_internal:
+                continue
+
+            link_text = a_tag.text_content().strip() or "No text"
+            links.append({
+                "url": full_url,
+                "text": link_text,
+                "type": "internal" if is_internal else "external"
+            })
+        
+        return _dumps({
+            "status": "success",
+            "source_url": url,
+            "count": len(links),
+            "links": links[:50]  # Limit to 50 links
+        })
+        
+    except Exception as e:
+        return _dumps({
+            "status": "error",
+            "message": f"Link extraction failed: {str(e)}",
+            "url": url
+        })
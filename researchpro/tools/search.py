@@ -7,41 +7,47 @@ from langchain.tools import tool
 from typing import List, Dict
 import requests
 from bs4 import BeautifulSoup
-import json
+import os
+import time
+from functools import lru_cache
 
+import orjson
 
-@tool
-def web_search(query: str, num_results: int = 5) -> str:
+from ._http import SESSION
+
+# Pretty-print tool JSON only when debugging; compact output is faster
+# to encode and costs the LLM fewer tokens to read back
+_INDENT = 2 if os.getenv("TOOL_DEBUG") else None
+
+def _dumps(obj: dict) -> str:
+    """Serialize a tool response with orjson (much faster than stdlib json)."""
+    option = orjson.OPT_INDENT_2 if _INDENT else 0
+    return orjson.dumps(obj, option=option).decode()
+
+
+# Cached results (including errors) live at most this long; the TTL
+# bucket in the cache key rolls them over without a background sweeper
+_CACHE_TTL = 600
+
+
+@lru_cache(maxsize=128)
+def _search_impl(query: str, num_results: int, _bucket: int) -> str:
     """
-    Search the web for information on a given topic using DuckDuckGo.
-    
-    This tool performs a web search and returns the top results with titles,
-    URLs, and snippets. It's useful for finding recent information, articles,
-    and resources on any topic.
-    
-    Args:
-        query (str): The search query to look up
-        num_results (int): Number of results to return (default: 5, max: 10)
-    
-    Returns:
-        str: JSON string containing search results with titles, URLs, and snippets
-    
-    Examples:
-        >>> web_search("AI in healthcare 2024")
-        >>> web_search("quantum computing applications", num_results=3)
+    Run one DuckDuckGo search, caching the full JSON response.
+
+    Agents re-issue identical queries within a session; the LRU serves
+    those repeats without a network round-trip. `_bucket` changes every
+    _CACHE_TTL seconds, so entries expire naturally.
     """
     try:
         # Use DuckDuckGo HTML search (no API key required)
         url = "https://html.duckduckgo.com/html/"
         params = {"q": query}
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-        
-        response = requests.post(url, data=params, headers=headers, timeout=10)
+
+        response = SESSION.post(url, data=params, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         results = []
         
         # Parse search results
@@ -64,33 +70,56 @@ def web_search(query: str, num_results: int = 5) -> str:
                 })
         
         if not results:
-            return json.dumps({
+            return _dumps({
                 "status": "no_results",
                 "message": f"No results found for query: {query}",
                 "results": []
             })
         
-        return json.dumps({
+        return _dumps({
             "status": "success",
             "query": query,
             "count": len(results),
             "results": results
-        }, indent=2)
+        })
         
     except requests.Timeout:
-        return json.dumps({
+        return _dumps({
             "status": "error",
             "message": "Search request timed out. Please try again.",
             "results": []
         })
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "status": "error",
             "message": f"Search failed: {str(e)}",
             "results": []
         })
 
 
+@tool
+def web_search(query: str, num_results: int = 5) -> str:
+    """
+    Search the web for information on a given topic using DuckDuckGo.
+
+    This tool performs a web search and returns the top results with titles,
+    URLs, and snippets. It's useful for finding recent information, articles,
+    and resources on any topic.
+
+    Args:
+        query (str): The search query to look up
+        num_results (int): Number of results to return (default: 5, max: 10)
+
+    Returns:
+        str: JSON string containing search results with titles, URLs, and snippets
+
+    Examples:
+        >>> web_search("AI in healthcare 2024")
+        >>> web_search("quantum computing applications", num_results=3)
+    """
+    return _search_impl(query, num_results, int(time.time() // _CACHE_TTL))
+
+
 @tool
 def web_search_simple(query: str) -> str:
     """
@@ -103,8 +132,8 @@ def web_search_simple(query: str) -> str:
     Returns:
         str: Brief summary of search results
     """
-    result = web_search(query, num_results=3)
-    data = json.loads(result)
+    result = _search_impl(query, 3, int(time.time() // _CACHE_TTL))
+    data = orjson.loads(result)
     
     if data["status"] != "success":
         return f"Search failed: {data.get('message', 'Unknown error')}"
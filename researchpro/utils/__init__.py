@@ -1,5 +1,6 @@
 """Utility modules for the ResearchPro Agent."""
 
 from .memory import ConversationMemory, save_conversation, load_conversation, list_conversations
+from .exec_cache import ExecutionCache
 
-__all__ = ["ConversationMemory", "save_conversation", "load_conversation", "list_conversations"]
+__all__ = ["ConversationMemory", "save_conversation", "load_conversation", "list_conversations", "ExecutionCache"]
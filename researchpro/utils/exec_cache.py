@@ -0,0 +1,104 @@
+"""
+Exact-match execution cache for the ResearchPro Agent.
+Stores final research states on disk so repeated identical queries
+return in milliseconds without spending tokens or HTTP calls.
+"""
+
+import hashlib
+import pickle
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class ExecutionCache:
+    """Persistent key-value cache of final research states."""
+
+    def __init__(self, cache_dir: str = ".cache", ttl: int = 86400):
+        """
+        Initialize the execution cache.
+
+        Args:
+            cache_dir: Directory to store the cache database
+            ttl: Time-to-live for entries in seconds (default: 24 hours)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(exist_ok=True)
+        self.ttl = ttl
+
+        self._conn = sqlite3.connect(
+            str(self.cache_dir / "exec_cache.db"),
+            check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS exec_cache ("
+            "key TEXT PRIMARY KEY, created_at REAL, state BLOB)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model_name: str, user_level: str, query: str) -> str:
+        """
+        Build a cache key from the config and the normalized query.
+
+        Args:
+            model_name: LLM model name
+            user_level: User expertise level (affects the system prompt)
+            query: The research query
+
+        Returns:
+            Hex digest identifying this (model, prompt, query) combination
+        """
+        normalized = " ".join(query.lower().split())
+        raw = f"{model_name}|{user_level}|{normalized}"
+        return hashlib.blake2b(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached final state.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The stored state dict, or None on miss/expiry
+        """
+        row = self._conn.execute(
+            "SELECT created_at, state FROM exec_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        created_at, blob = row
+        if self.ttl and (time.time() - created_at) > self.ttl:
+            self._conn.execute("DELETE FROM exec_cache WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+
+        try:
+            return pickle.loads(blob)
+        except (pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+
+    def put(self, key: str, state: Dict) -> None:
+        """
+        Store a final state. Message objects should be pre-serialized to
+        dicts so the entry stays loadable across library upgrades.
+
+        Args:
+            key: Cache key from make_key()
+            state: The final state dict to store
+        """
+        blob = pickle.dumps(state)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO exec_cache (key, created_at, state) VALUES (?, ?, ?)",
+            (key, time.time(), blob)
+        )
+        self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._conn.execute("DELETE FROM exec_cache")
+        self._conn.commit()
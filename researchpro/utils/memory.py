@@ -0,0 +1,736 @@
+"""
+Conversation memory storage for the ResearchPro Agent.
+Saves and retrieves conversation history for PDF generation and analysis.
+"""
+
+import fcntl
+import hashlib
+import heapq
+import os
+import re
+import time
+import weakref
+import orjson
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Final, List, Dict, Optional
+from pathlib import Path
+
+
+# Sentinel distinguishing "attribute absent" from any real value
+_MISSING = object()
+
+# Compiled once; _generate_conversation_name runs on every new-session save
+_NAME_STRIP_RE = re.compile(r'[^a-zA-Z0-9\s-]')
+_WS_RE = re.compile(r'\s+')
+
+# Recently loaded conversations kept per memory instance
+_LOAD_CACHE_MAX: Final = 32
+
+# Serialized-message memo shared by all memory instances, keyed by
+# object identity; bounded so long-running sessions can't grow it forever.
+# Each entry carries a weakref to its message: id() values are recycled
+# after garbage collection, so a hit only counts when the stored ref
+# still points at the very object being serialized.
+_SERIALIZE_CACHE: Dict[int, tuple] = {}
+_SERIALIZE_CACHE_MAX: Final = 4096
+
+
+class ConversationMemory:
+    """Manages conversation history storage."""
+
+    # No instance __dict__: the class is instantiated per storage dir by
+    # the module helpers, and slotted attribute access is cheaper on the
+    # per-turn save/load paths
+    __slots__ = ('storage_dir', 'auto_save_interval', '_load_cache', '_pending')
+
+    def __init__(self, storage_dir: str = "conversations", auto_save_interval: int = 5):
+        """
+        Initialize conversation memory.
+
+        Args:
+            storage_dir: Directory to store conversation files
+            auto_save_interval: fsync metadata every N turns instead of
+                every save; writes stay atomic either way, this only
+                bounds how much the OS may buffer before a crash
+        """
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(exist_ok=True)
+        self.auto_save_interval = auto_save_interval
+        # LRU of fully loaded conversations keyed by (id, mtime_ns);
+        # the mtime in the key makes stale entries miss automatically
+        self._load_cache = OrderedDict()
+        # Turns since the last fsync, per conversation id
+        self._pending = {}
+
+    # Each conversation is stored as a small metadata JSON plus an
+    # append-only JSONL transcript (one message per line), so adding a
+    # turn writes only the new messages instead of rewriting the whole
+    # history. Conversations saved by older versions as one monolithic
+    # {id}.json are migrated on first touch.
+
+    def _meta_path(self, conversation_id: str) -> Path:
+        return self.storage_dir / f"{conversation_id}.meta.json"
+
+    def _transcript_path(self, conversation_id: str) -> Path:
+        return self.storage_dir / f"{conversation_id}.transcript.jsonl"
+
+    def _legacy_path(self, conversation_id: str) -> Path:
+        return self.storage_dir / f"{conversation_id}.json"
+
+    @contextmanager
+    def _locked(self, conversation_id: str, timeout: float = 10.0):
+        """
+        Hold an exclusive per-conversation file lock.
+
+        Serializes concurrent savers (e.g. the agent's background writer
+        racing an explicit save) so meta and transcript stay consistent.
+        """
+        lock_fd = os.open(self.storage_dir / f"{conversation_id}.lock",
+                          os.O_CREAT | os.O_RDWR)
+        try:
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(
+                            f"Timed out locking conversation {conversation_id}"
+                        )
+                    time.sleep(0.05)
+            yield
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
+
+    def _write_meta(self, conversation_id: str, meta: Dict, fsync: bool = True) -> None:
+        """
+        Replace the metadata file atomically (tmp file + rename), so a
+        crash mid-write can never leave a truncated file behind. fsync
+        may be skipped by the debounced per-turn save path.
+        """
+        filepath = self._meta_path(conversation_id)
+        tmp_path = filepath.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            # Compact on disk; dump_pretty() renders an indented view
+            # when a human actually needs to read one
+            f.write(orjson.dumps(meta))
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+
+    def _load_meta(self, conversation_id: str) -> Optional[Dict]:
+        """Read a conversation's metadata file, or None if absent."""
+        filepath = self._meta_path(conversation_id)
+        if not filepath.exists():
+            return None
+        return orjson.loads(filepath.read_bytes())
+
+    def load_conversation_iter(self, conversation_id: str):
+        """
+        Stream a conversation's messages one dict at a time.
+
+        Memory stays constant no matter how long the transcript is;
+        callers that only need the last N turns can wrap this in
+        collections.deque(..., maxlen=N) instead of loading everything.
+
+        Args:
+            conversation_id: The conversation ID to stream
+
+        Yields:
+            Serialized message dicts in transcript order
+        """
+        filepath = self._transcript_path(conversation_id)
+        if filepath.exists():
+            with open(filepath, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # A final line without its newline is a torn
+                        # append from a crash mid-write; every message
+                        # before it is intact, so keep those and stop
+                        if not line.endswith(b"\n"):
+                            break
+                        continue
+            return
+
+        # Fall back to the monolithic format from older versions
+        legacy = self._legacy_path(conversation_id)
+        if legacy.exists():
+            yield from orjson.loads(legacy.read_bytes()).get("messages", [])
+
+    def _append_transcript(self, conversation_id: str, messages: List[Dict]) -> None:
+        """Append serialized messages to the transcript, one per line."""
+        with open(self._transcript_path(conversation_id), "ab") as f:
+            for msg in messages:
+                # The newline is emitted inside the same native call, so
+                # no per-line bytes concatenation
+                f.write(orjson.dumps(msg, option=orjson.OPT_APPEND_NEWLINE))
+
+    def _migrate_legacy(self, conversation_id: str, data: Dict) -> Dict:
+        """
+        Split a monolithic conversation file into meta + transcript.
+
+        Returns the metadata dict (messages moved to the transcript).
+        """
+        meta = {k: v for k, v in data.items() if k != "messages"}
+        messages = data.get("messages", [])
+        meta["message_count"] = len(messages)
+        self._append_transcript(conversation_id, messages)
+        self._write_meta(conversation_id, meta)
+        self._legacy_path(conversation_id).unlink()
+        return meta
+
+    def save_conversation(
+        self,
+        query: str,
+        answer: str,
+        messages: List[Dict],
+        citations: List[Dict] = None,
+        metadata: Dict = None,
+        conversation_id: str = None,
+        conversation_name: str = None
+    ) -> str:
+        """
+        Save a conversation to disk.
+        
+        Args:
+            query: The research query
+            answer: The final answer
+            messages: Messages added since the last save. When creating a
+                new conversation this is simply all of its messages; when
+                appending, pass only the new turn's messages — callers
+                window their context, so the on-disk count says nothing
+                about where "new" starts in the list they hold
+            citations: Optional list of citations
+            metadata: Optional metadata (model, temperature, etc.)
+            conversation_id: If provided, append to existing conversation; otherwise create new
+            conversation_name: Optional custom name for the conversation
+        
+        Returns:
+            Conversation ID (timestamp-based filename)
+        """
+        # If conversation_id provided, append to the existing conversation
+        if conversation_id:
+            with self._locked(conversation_id):
+                meta = self._load_meta(conversation_id)
+                if meta is None and self._legacy_path(conversation_id).exists():
+                    meta = self._migrate_legacy(
+                        conversation_id,
+                        orjson.loads(self._legacy_path(conversation_id).read_bytes())
+                    )
+                if meta is not None:
+                    # One clock read per turn; the exchange and
+                    # last_updated stamps should agree anyway
+                    now_iso = datetime.now().isoformat()
+                    # Append new query-answer pair
+                    meta.setdefault("exchanges", []).append({
+                        "query": query,
+                        "answer": answer,
+                        "timestamp": now_iso
+                    })
+                    meta["last_updated"] = now_iso
+                    meta["citations"] = citations or meta.get("citations", [])
+
+                    # The caller hands us only this turn's new messages;
+                    # prior turns are already on disk in serialized form
+                    new_serialized = self._serialize_messages(messages)
+                    self._append_transcript(conversation_id, new_serialized)
+                    meta["message_count"] = (
+                        meta.get("message_count", 0) + len(new_serialized)
+                    )
+
+                    # Debounce the expensive fsync: the metadata rewrite
+                    # itself is atomic every turn, but it only forces its
+                    # way to stable storage every auto_save_interval turns
+                    pending = self._pending.get(conversation_id, 0) + 1
+                    do_sync = pending >= self.auto_save_interval
+                    self._write_meta(conversation_id, meta, fsync=do_sync)
+                    self._pending[conversation_id] = 0 if do_sync else pending
+                    self._evict_loaded(conversation_id)
+
+                    return conversation_id
+
+        # Create new conversation (callers may pre-generate the ID so they
+        # don't have to wait on the write to learn it)
+        timestamp = datetime.now()
+        ts_iso = timestamp.isoformat()
+        if not conversation_id:
+            conversation_id = self.new_conversation_id()
+
+        # Generate meaningful name from query if not provided
+        if not conversation_name:
+            conversation_name = self._generate_conversation_name(query)
+
+        serialized = self._serialize_messages(messages)
+        meta = {
+            "id": conversation_id,
+            "name": conversation_name,
+            "created_at": ts_iso,
+            "last_updated": ts_iso,
+            "exchanges": [
+                {
+                    "query": query,
+                    "answer": answer,
+                    "timestamp": ts_iso
+                }
+            ],
+            "citations": citations or [],
+            "metadata": metadata or {},
+            "message_count": len(serialized)
+        }
+
+        with self._locked(conversation_id):
+            # A transcript without metadata is a leftover (torn delete or
+            # reused ID); clobber it rather than append a new conversation
+            # onto a stranger's messages
+            transcript_path = self._transcript_path(conversation_id)
+            if transcript_path.exists():
+                transcript_path.unlink()
+            self._append_transcript(conversation_id, serialized)
+            self._write_meta(conversation_id, meta)
+        self._evict_loaded(conversation_id)
+
+        return conversation_id
+    
+    @staticmethod
+    def new_conversation_id() -> str:
+        """
+        Generate a timestamp-based conversation ID.
+
+        Microsecond precision: with append-only storage, two sessions
+        created in the same second must not share an ID, or the second
+        would silently append into the first's transcript.
+        """
+        return datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+
+    def load_conversation(
+        self,
+        conversation_id: str,
+        stripped: bool = False,
+        max_content_bytes: int = 4096
+    ) -> Optional[Dict]:
+        """
+        Load a conversation from disk.
+
+        Args:
+            conversation_id: The conversation ID to load
+            stripped: Replace oversized message content with a short
+                placeholder; useful for previews of very long sessions
+            max_content_bytes: Content size above which stripping applies
+
+        Returns:
+            Conversation data or None if not found
+        """
+        # Serve repeat loads of an unchanged conversation from the LRU
+        # (one stat, no JSON parse); stripped views are cheap projections
+        # and bypass the cache
+        cache_key = None
+        if not stripped:
+            mtime_ns = self._conversation_mtime_ns(conversation_id)
+            if mtime_ns is not None:
+                cache_key = (conversation_id, mtime_ns)
+                cached = self._load_cache.get(cache_key)
+                if cached is not None:
+                    self._load_cache.move_to_end(cache_key)
+                    return self._copy_loaded(cached)
+
+        meta = self._load_meta(conversation_id)
+        if meta is not None:
+            data = dict(meta)
+            data.pop("message_count", None)
+            messages = self.load_conversation_iter(conversation_id)
+            if stripped:
+                messages = (self._strip_message(m, max_content_bytes) for m in messages)
+            data["messages"] = list(messages)
+            return self._remember_loaded(cache_key, data)
+
+        # Fall back to the monolithic format from older versions
+        filepath = self._legacy_path(conversation_id)
+        if not filepath.exists():
+            return None
+
+        data = orjson.loads(filepath.read_bytes())
+        if stripped and "messages" in data:
+            data["messages"] = [
+                self._strip_message(m, max_content_bytes) for m in data["messages"]
+            ]
+        return self._remember_loaded(cache_key, data)
+
+    def load_conversations(self, conversation_ids: List[str]) -> List[Optional[Dict]]:
+        """
+        Load several conversations at once, overlapping the disk reads.
+
+        File reads and orjson parsing both release the GIL, so a thread
+        pool hydrates a recent-conversations view in roughly the time of
+        the slowest single load instead of the sum of all of them.
+
+        Args:
+            conversation_ids: Conversation IDs to load
+
+        Returns:
+            One entry per ID, in input order; None where an ID is missing
+        """
+        if not conversation_ids:
+            return []
+        if len(conversation_ids) == 1:
+            return [self.load_conversation(conversation_ids[0])]
+        with ThreadPoolExecutor(max_workers=min(8, len(conversation_ids))) as executor:
+            return list(executor.map(self.load_conversation, conversation_ids))
+
+    def _evict_loaded(self, conversation_id: str) -> None:
+        """Drop any cached loads of a conversation that just changed."""
+        for key in [k for k in self._load_cache if k[0] == conversation_id]:
+            del self._load_cache[key]
+
+    def _conversation_mtime_ns(self, conversation_id: str) -> Optional[int]:
+        """mtime of the file that defines a conversation, or None."""
+        for path in (self._meta_path(conversation_id), self._legacy_path(conversation_id)):
+            try:
+                return path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+        return None
+
+    def _remember_loaded(self, cache_key, data: Dict) -> Dict:
+        """Store a loaded conversation in the LRU and return a copy."""
+        if cache_key is None:
+            return data
+        self._load_cache[cache_key] = data
+        while len(self._load_cache) > _LOAD_CACHE_MAX:
+            self._load_cache.popitem(last=False)
+        return self._copy_loaded(data)
+
+    @staticmethod
+    def _copy_loaded(data: Dict) -> Dict:
+        """Copy a cached conversation so list mutations don't leak back."""
+        copied = dict(data)
+        if "messages" in copied:
+            copied["messages"] = list(copied["messages"])
+        return copied
+
+    def flush(self, conversation_id: str = None) -> None:
+        """
+        Force any debounce-deferred metadata to stable storage.
+
+        Args:
+            conversation_id: Flush one conversation, or all pending ones
+                when omitted
+        """
+        if conversation_id is not None:
+            ids = [conversation_id]
+        else:
+            ids = [cid for cid, count in self._pending.items() if count]
+        for cid in ids:
+            filepath = self._meta_path(cid)
+            if filepath.exists():
+                fd = os.open(filepath, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            self._pending[cid] = 0
+
+    def dump_pretty(self, conversation_id: str) -> Optional[str]:
+        """
+        Render a full conversation as indented JSON for human reading.
+
+        Args:
+            conversation_id: The conversation ID to render
+
+        Returns:
+            Pretty-printed JSON string, or None if not found
+        """
+        data = self.load_conversation(conversation_id)
+        if data is None:
+            return None
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+    @staticmethod
+    def _strip_message(msg: Dict, max_content_bytes: int) -> Dict:
+        """Replace oversized content with a sized, hashed placeholder."""
+        content = msg.get("content")
+        if isinstance(content, str) and len(content) > max_content_bytes:
+            digest = hashlib.sha256(content.encode()).hexdigest()[:12]
+            msg = dict(msg)
+            msg["content"] = f"[elided {len(content)} bytes, sha256={digest}]"
+        return msg
+    
+    def list_conversations(self, limit: int = 50) -> List[Dict]:
+        """
+        List all saved conversations.
+        
+        Args:
+            limit: Maximum number of conversations to return
+        
+        Returns:
+            List of conversation summaries (id, timestamp, query)
+        """
+        # One-shot migration of monolithic files from older versions, so
+        # the listing below only ever parses small metadata files instead
+        # of full transcripts
+        for filepath in self.storage_dir.glob("*.json"):
+            if filepath.name.startswith(".") or filepath.name.endswith(".meta.json"):
+                continue
+            try:
+                self._migrate_legacy(filepath.stem, orjson.loads(filepath.read_bytes()))
+            except orjson.JSONDecodeError:
+                continue
+
+        # Sidecar index keyed by filename + mtime: metadata files that
+        # haven't changed since the last listing skip JSON parsing, so a
+        # steady-state listing is one stat per conversation
+        index_path = self.storage_dir / ".index.json"
+        try:
+            index = orjson.loads(index_path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            index = {}
+
+        entries = []
+        seen = set()
+        dirty = False
+        with os.scandir(self.storage_dir) as it:
+            meta_entries = [e for e in it if e.name.endswith(".meta.json")]
+
+        for entry in meta_entries:
+            seen.add(entry.name)
+            mtime_ns = entry.stat().st_mtime_ns
+            cached = index.get(entry.name)
+            if cached and cached.get("mtime_ns") == mtime_ns:
+                entries.append((entry.name, cached["summary"]))
+                continue
+            try:
+                # entry.path is already a string; no Path object needed
+                with open(entry.path, "rb") as f:
+                    summary = self._summarize_meta(orjson.loads(f.read()))
+            except (orjson.JSONDecodeError, KeyError):
+                continue
+            index[entry.name] = {"mtime_ns": mtime_ns, "summary": summary}
+            entries.append((entry.name, summary))
+            dirty = True
+
+        # Prune index entries for deleted conversations
+        stale = index.keys() - seen
+        if stale:
+            for name in stale:
+                del index[name]
+            dirty = True
+
+        if dirty:
+            tmp_path = self.storage_dir / ".index.json.tmp"
+            tmp_path.write_bytes(orjson.dumps(index))
+            os.replace(tmp_path, index_path)
+
+        # Filenames are timestamp-prefixed, so string order is creation
+        # order; nlargest keeps only `limit` entries instead of sorting
+        # the whole directory
+        newest = heapq.nlargest(limit, entries, key=lambda entry: entry[0])
+        return [summary for _, summary in newest]
+
+    @staticmethod
+    def _summarize_meta(data: Dict) -> Dict:
+        """Build a listing summary from one conversation's metadata."""
+        # Support both old and new format
+        if "exchanges" in data:
+            first_query = data["exchanges"][0]["query"][:100] if data["exchanges"] else "N/A"
+            total_exchanges = len(data["exchanges"])
+        else:
+            # Old format
+            first_query = data.get("query", "N/A")[:100]
+            total_exchanges = 1
+
+        return {
+            "id": data["id"],
+            "name": data.get("name", first_query[:50]),
+            "timestamp": data.get("created_at", data.get("timestamp", "N/A")),
+            "last_updated": data.get("last_updated", data.get("timestamp", "N/A")),
+            "first_query": first_query,
+            "total_exchanges": total_exchanges
+        }
+    
+    def delete_conversation(self, conversation_id: str) -> bool:
+        """
+        Delete a conversation.
+        
+        Args:
+            conversation_id: The conversation ID to delete
+        
+        Returns:
+            True if deleted, False if not found
+        """
+        deleted = False
+        for filepath in (
+            self._meta_path(conversation_id),
+            self._transcript_path(conversation_id),
+            self._legacy_path(conversation_id),
+        ):
+            if filepath.exists():
+                filepath.unlink()
+                deleted = True
+        if deleted:
+            self._evict_loaded(conversation_id)
+        return deleted
+    
+    def _generate_conversation_name(self, query: str, max_length: int = 50) -> str:
+        """
+        Generate a meaningful conversation name from the query.
+        
+        Args:
+            query: The first query in the conversation
+            max_length: Maximum length for the name
+        
+        Returns:
+            Clean conversation name
+        """
+        # Remove special characters and clean up
+        clean_query = _WS_RE.sub(' ', _NAME_STRIP_RE.sub('', query)).strip()
+        
+        # Truncate and capitalize first letter of each word
+        words = clean_query.split()[:8]  # Take first 8 words
+        name = ' '.join(words)
+        
+        if len(name) > max_length:
+            name = name[:max_length].rsplit(' ', 1)[0]  # Cut at word boundary
+        
+        return name or "Untitled Conversation"
+    
+    @staticmethod
+    def _serialize_messages(messages: List) -> List[Dict]:
+        """
+        Serialize message objects to dict format.
+
+        Results are memoized by object identity, so a message that is
+        serialized again (e.g. context re-serialized for the execution
+        cache) is not walked twice. A hit requires the entry's weakref to
+        still resolve to the same object — a bare id() key would return a
+        dead message's serialization for any new object allocated at the
+        recycled address. Call invalidate_serialize_cache() to drop the
+        memo.
+
+        Args:
+            messages: List of message objects
+
+        Returns:
+            List of serialized messages
+        """
+        cache = _SERIALIZE_CACHE
+        serialized = []
+        for msg in messages:
+            # Fetch each attribute once with a sentinel default instead
+            # of hasattr-probing and then reading it again
+            content = getattr(msg, 'content', _MISSING)
+            if content is not _MISSING:
+                entry = cache.get(id(msg))
+                if entry is not None and entry[0]() is msg:
+                    serialized.append(entry[1])
+                    continue
+
+                msg_dict = {
+                    "type": type(msg).__name__,
+                    "content": content
+                }
+
+                # Include tool calls if present
+                tool_calls = getattr(msg, 'tool_calls', None)
+                if tool_calls:
+                    msg_dict["tool_calls"] = [
+                        {
+                            "name": tc.get("name"),
+                            "args": tc.get("args")
+                        } for tc in tool_calls
+                    ]
+
+                # Include tool call ID if present
+                tool_call_id = getattr(msg, 'tool_call_id', _MISSING)
+                if tool_call_id is not _MISSING:
+                    msg_dict["tool_call_id"] = tool_call_id
+
+                try:
+                    ref = weakref.ref(msg)
+                except TypeError:
+                    pass  # not weakref-able; serialize without memoizing
+                else:
+                    if len(cache) >= _SERIALIZE_CACHE_MAX:
+                        cache.clear()
+                    cache[id(msg)] = (ref, msg_dict)
+
+                serialized.append(msg_dict)
+            elif isinstance(msg, dict):
+                serialized.append(msg)
+
+        return serialized
+
+    @staticmethod
+    def invalidate_serialize_cache() -> None:
+        """Drop all memoized message serializations."""
+        _SERIALIZE_CACHE.clear()
+
+
+# Convenience functions for global usage. Instances are memoized per
+# storage directory so repeated helper calls skip re-running __init__
+# (and its mkdir syscall) every time.
+_memory_cache: Dict[str, ConversationMemory] = {}
+
+
+def _get_memory(storage_dir: str = "conversations") -> ConversationMemory:
+    """Return the shared ConversationMemory for a storage directory."""
+    memory = _memory_cache.get(storage_dir)
+    if memory is None:
+        memory = _memory_cache[storage_dir] = ConversationMemory(storage_dir)
+    return memory
+
+
+def save_conversation(
+    query: str,
+    answer: str,
+    messages: List,
+    citations: List[Dict] = None,
+    metadata: Dict = None,
+    conversation_id: str = None,
+    conversation_name: str = None,
+    storage_dir: str = "conversations"
+) -> str:
+    """
+    Save a conversation using the default memory instance.
+    
+    Args:
+        query: The research query
+        answer: The final answer
+        messages: List of all messages
+        citations: Optional citations
+        metadata: Optional metadata
+        conversation_id: Optional existing conversation ID to append to
+        conversation_name: Optional custom name for the conversation
+        storage_dir: Storage directory
+    
+    Returns:
+        Conversation ID
+    """
+    return _get_memory(storage_dir).save_conversation(
+        query, answer, messages, citations, metadata, conversation_id, conversation_name
+    )
+
+
+def load_conversation(conversation_id: str, storage_dir: str = "conversations") -> Optional[Dict]:
+    """Load a conversation by ID."""
+    return _get_memory(storage_dir).load_conversation(conversation_id)
+
+
+def load_conversations(
+    conversation_ids: List[str], storage_dir: str = "conversations"
+) -> List[Optional[Dict]]:
+    """Load several conversations by ID, overlapping the disk reads."""
+    return _get_memory(storage_dir).load_conversations(conversation_ids)
+
+
+def list_conversations(limit: int = 50, storage_dir: str = "conversations") -> List[Dict]:
+    """List all saved conversations."""
+    return _get_memory(storage_dir).list_conversations(limit)
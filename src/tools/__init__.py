@@ -1,9 +0,0 @@
-"""Tools package initialization."""
-
-from .search import web_search
-from .scraper import scrape_webpage
-
-__all__ = [
-    "web_search",
-    "scrape_webpage",
-]